@@ -10,35 +10,218 @@ Sources:
 - Congress.gov (Congressional Record)
 """
 
+import functools
 import json
 import os
+import pickle
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from transcript_ids import url_id
+from worker_pools import process_pool
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
 # Add scripts directory to path
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / 'data'
 DATA_DIR.mkdir(exist_ok=True)
 
-def load_existing_transcripts():
-    """Load existing transcripts from data directory."""
-    transcripts_file = DATA_DIR / 'transcripts.json'
+# Near-duplicate detection (needs datasketch): C-SPAN republishes the same
+# speech under new URLs, so new transcripts are also compared by content
+MINHASH_FILE = DATA_DIR / 'minhash_sigs.pkl'
+MINHASH_PERM = 128
+NEAR_DUP_THRESHOLD = 0.8
+
+# Ids whose hash part comes from the source URL: C-SPAN, and the White House
+# collector's 8-hex-digit wh-/wh-briefing- ids (not the JS collector's
+# timestamped ones)
+_URL_ID_RE = re.compile(r'(cspan-).+|(wh-(?:briefing-)?)[0-9a-f]{8}')
+
+# Simple quote extraction based on keyword groups. All groups are fused into a
+# single alternation so each sentence is scanned once; the group that matched
+# (m.lastgroup) selects the categories it contributes. "alien" is listed as
+# both dehumanizing language and an immigration topic, so it has its own group.
+_QUOTE_GROUPS = {
+    # Absolutist claims
+    'absolutist': (r'always|never|everyone|no one|every single|all of|none of', ('absolutist-claims',)),
+    # Dehumanizing language
+    'dehumanizing': (r'animal|vermin|pest|infestation|invasion|flood', ('dehumanizing-language',)),
+    'alien': (r'alien', ('dehumanizing-language', 'immigration')),
+    # Violent rhetoric
+    'violent': (r'destroy|eliminate|wipe out|fight|attack|war on|enemy', ('violent-rhetoric',)),
+    # Immigration topics
+    'immigration': (r'immigrant|border|deportation|migrant|illegal', ('immigration',)),
+    # Election topics
+    'election': (r'vote|election|ballot|fraud|rigged|stolen', ('election',)),
+}
+
+# Letters a keyword can start with. The lookahead rejects every other position
+# with one character-class test before the engine tries the ~30 alternatives
+_TRIGGER_CHARS = ''.join(sorted({word[0] for alts, _ in _QUOTE_GROUPS.values() for word in alts.split('|')}))
+
+_QUOTE_SRC = (
+    rf'(?=[{_TRIGGER_CHARS}])\b(?:'
+    + '|'.join(f'(?P<{name}>{alts})' for name, (alts, _) in _QUOTE_GROUPS.items())
+    + r')\b'
+)
+
+# Transcripts are scanned lowercased, which lets the engine skip case folding;
+# the case-insensitive variant covers text whose length lower() would change
+_QUOTE_RE = re.compile(_QUOTE_SRC)
+_QUOTE_RE_ANYCASE = re.compile(_QUOTE_SRC, re.IGNORECASE)
+
+_CAT_MAP = {name: cats for name, (_, cats) in _QUOTE_GROUPS.items()}
+_RHETORIC_CATEGORIES = frozenset({'absolutist-claims', 'dehumanizing-language', 'violent-rhetoric'})
+
+_SENT_SPLIT = re.compile(r'[.!?]+')
+
+
+def _build_automaton():
+    """Build an Aho-Corasick automaton over every quote keyword, if pyahocorasick is installed."""
+    if ahocorasick is None:
+        return None
+
+    # The group alternations are plain literals, so they can be split back into words
+    automaton = ahocorasick.Automaton()
+    for alts, cats in _QUOTE_GROUPS.values():
+        for word in alts.split('|'):
+            automaton.add_word(word, (len(word), cats))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def load_database(transcripts_file=None):
+    """Load the whole transcripts.json document, keeping stats and contradictions."""
+    transcripts_file = transcripts_file or DATA_DIR / 'transcripts.json'
+    data = {}
     if transcripts_file.exists():
-        with open(transcripts_file) as f:
-            data = json.load(f)
-            return data.get('transcripts', [])
-    return []
+        if orjson is not None:
+            data = orjson.loads(transcripts_file.read_bytes())
+        else:
+            with open(transcripts_file) as f:
+                data = json.load(f)
 
+    data['transcripts'] = migrate_legacy_ids(data.get('transcripts', []))
+    return data
 
-def save_transcripts(transcripts):
-    """Save merged transcripts to main file."""
-    transcripts_file = DATA_DIR / 'transcripts.json'
 
-    # Calculate stats
-    by_speaker = {}
-    by_topic = {}
-    by_rhetoric = {}
+def migrate_legacy_ids(transcripts):
+    """Rewrite URL-derived ids that don't match the current url_id() scheme.
+
+    Ids from the old hash()-based scheme changed between runs, and URLs were
+    not canonicalized, so one page may be stored several times; only the
+    first record per stable id is kept.
+    """
+    migrated = []
+    seen = set()
+
+    for t in transcripts:
+        old_id = t['id']
+        new_id = migrated_id(old_id, t.get('sourceUrl'))
+        if new_id != old_id:
+            t['id'] = new_id
+            for quote in t.get('extractedQuotes', []):
+                if quote.get('id', '').startswith(f"{old_id}-"):
+                    quote['id'] = new_id + quote['id'][len(old_id):]
+
+        if t['id'] in seen:
+            continue
+        seen.add(t['id'])
+        migrated.append(t)
+
+    return migrated
+
+
+def migrated_id(transcript_id, source_url):
+    """Return the current url_id()-based id for a stored transcript id."""
+    m = _URL_ID_RE.fullmatch(transcript_id)
+    if m and source_url:
+        return f"{m.group(1) or m.group(2)}{url_id(source_url)}"
+    return transcript_id
+
+
+def load_id_index(transcripts_file):
+    """Load the set of stored transcript ids from the sidecar index.
+
+    The index (transcripts.ids, one id per line) is rebuilt from
+    transcripts.json when missing or older than it, e.g. after a hand edit.
+    """
+    index_file = transcripts_file.with_suffix('.ids')
+    if not transcripts_file.exists():
+        return set()
+
+    if index_file.exists() and index_file.stat().st_mtime >= transcripts_file.stat().st_mtime:
+        return set(index_file.read_text().split())
+
+    ids = existing_ids_stream(transcripts_file)
+    save_id_index(transcripts_file, ids)
+    return ids
+
+
+def save_id_index(transcripts_file, ids):
+    """Write the sidecar id index next to transcripts.json."""
+    index_file = transcripts_file.with_suffix('.ids')
+    index_file.write_text(''.join(f"{transcript_id}\n" for transcript_id in ids))
+
+
+def existing_ids_stream(transcripts_file):
+    """Collect the ids of stored transcripts without keeping their bodies in memory.
+
+    Ids are migrated as load_database() would, so they match the stored
+    records once those are loaded.
+    """
+    if not transcripts_file.exists():
+        return set()
+
+    if ijson is None:
+        return {t['id'] for t in load_database(transcripts_file)['transcripts']}
+
+    ids = set()
+    transcript_id = source_url = None
+    with open(transcripts_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'transcripts.item.id':
+                transcript_id = value
+            elif prefix == 'transcripts.item.sourceUrl':
+                source_url = value
+            elif prefix == 'transcripts.item' and event == 'end_map':
+                ids.add(migrated_id(transcript_id, source_url))
+                transcript_id = source_url = None
+    return ids
+
+
+def update_stats(stats, transcripts):
+    """Add the speaker, topic and rhetoric counts of transcripts to stats in place."""
+    by_speaker = stats.setdefault('bySpeaker', {})
+    by_topic = stats.setdefault('byTopic', {})
+    by_rhetoric = stats.setdefault('byRhetoric', {})
+
+    stats['totalTranscripts'] = stats.get('totalTranscripts', 0) + len(transcripts)
+    stats['totalQuotes'] = stats.get('totalQuotes', 0) + sum(len(t.get('extractedQuotes', [])) for t in transcripts)
 
     for t in transcripts:
         speaker_id = t.get('speakerId', 'unknown')
@@ -50,49 +233,149 @@ def save_transcripts(transcripts):
             for rhet in quote.get('rhetoric', []):
                 by_rhetoric[rhet] = by_rhetoric.get(rhet, 0) + 1
 
+
+# Stats keys counted by update_stats(); everything else in stats is left alone
+_COUNTED_STATS = ('totalTranscripts', 'totalQuotes', 'bySpeaker', 'byTopic', 'byRhetoric')
+
+
+def rebuild_stats(stats, transcripts):
+    """Recount stats from scratch, leaving keys maintained elsewhere (e.g. contradictions) alone."""
+    for key in _COUNTED_STATS:
+        stats.pop(key, None)
+    update_stats(stats, transcripts)
+
+
+def stats_match(stats, transcripts):
+    """Whether stats can be updated incrementally for transcripts.
+
+    Stats written by hand or by an older version may lack counts or be out of
+    date, and migrate_legacy_ids() may have dropped duplicate records since
+    they were written; in any of those cases they have to be recounted.
+    """
+    if not all(key in stats for key in _COUNTED_STATS):
+        return False
+    return (stats['totalTranscripts'] == len(transcripts)
+            and stats['totalQuotes'] == sum(len(t.get('extractedQuotes', [])) for t in transcripts))
+
+
+def save_transcripts(database, pretty=False):
+    """Save the transcripts database to the main file.
+
+    Output is compact unless pretty is set; `python -m json.tool` formats it
+    on demand. The document is written to a temporary file and moved into
+    place, so an interrupted save never leaves a truncated transcripts.json.
+    """
+    transcripts_file = DATA_DIR / 'transcripts.json'
+    tmp_file = transcripts_file.with_name(transcripts_file.name + '.tmp')
+    transcripts = database['transcripts']
+
     data = {
         "_schema": {
             "description": "Political speech transcripts database",
             "version": "1.0.0"
         },
-        "transcripts": transcripts,
-        "lastUpdated": datetime.now().isoformat(),
-        "stats": {
-            "totalTranscripts": len(transcripts),
-            "totalQuotes": sum(len(t.get('extractedQuotes', [])) for t in transcripts),
-            "bySpeaker": by_speaker,
-            "byTopic": by_topic,
-            "byRhetoric": by_rhetoric
-        }
+        **database,
+        "lastUpdated": datetime.now().isoformat()
     }
 
-    with open(transcripts_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        tmp_file.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(tmp_file, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_file, transcripts_file)
+
+    save_id_index(transcripts_file, (t['id'] for t in transcripts))
 
     print(f"Saved {len(transcripts)} transcripts to {transcripts_file}")
 
 
+def _minhash(text):
+    """MinHash signature of a transcript over its word 5-gram shingles."""
+    words = text.lower().split()
+    shingles = {' '.join(words[i:i + 5]) for i in range(max(len(words) - 4, 1))}
+    sig = MinHash(num_perm=MINHASH_PERM)
+    sig.update_batch([s.encode('utf-8') for s in shingles])
+    return sig
+
+
+def load_near_dup_index(existing):
+    """Load the persisted MinHash LSH index, bringing it in line with existing.
+
+    The index is rebuilt if it holds ids that are no longer stored, and any
+    stored transcript it is missing is added.
+    """
+    index = None
+    if MINHASH_FILE.exists():
+        with open(MINHASH_FILE, 'rb') as f:
+            index = pickle.load(f)
+
+    existing_ids = {t['id'] for t in existing}
+    if index is None or not index['ids'] <= existing_ids:
+        index = {"ids": set(), "lsh": MinHashLSH(threshold=NEAR_DUP_THRESHOLD, num_perm=MINHASH_PERM)}
+
+    for t in existing:
+        if t.get('fullText') and t['id'] not in index['ids']:
+            index['lsh'].insert(t['id'], _minhash(t['fullText']))
+            index['ids'].add(t['id'])
+
+    return index
+
+
+def save_near_dup_index(index):
+    """Persist the MinHash LSH index for the next run."""
+    with open(MINHASH_FILE, 'wb') as f:
+        pickle.dump(index, f)
+
+
 def merge_transcripts(existing, new_transcripts):
-    """Merge new transcripts with existing, avoiding duplicates."""
+    """Merge new transcripts into existing in place, avoiding duplicates.
+
+    With datasketch installed, transcripts whose text is a near-duplicate
+    (estimated Jaccard >= NEAR_DUP_THRESHOLD) of a stored one are dropped too.
+    """
     existing_ids = {t['id'] for t in existing}
-    merged = existing.copy()
+    near_dups = load_near_dup_index(existing) if MinHashLSH is not None else None
 
     added = 0
+    skipped = 0
     for t in new_transcripts:
-        if t['id'] not in existing_ids:
-            merged.append(t)
-            existing_ids.add(t['id'])
-            added += 1
+        if t['id'] in existing_ids:
+            continue
+
+        if near_dups is not None and t.get('fullText'):
+            sig = _minhash(t['fullText'])
+            if near_dups['lsh'].query(sig):
+                skipped += 1
+                continue
+            near_dups['lsh'].insert(t['id'], sig)
+            near_dups['ids'].add(t['id'])
+
+        existing.append(t)
+        existing_ids.add(t['id'])
+        added += 1
 
-    print(f"Added {added} new transcripts, {len(merged)} total")
-    return merged
+    if near_dups is not None:
+        save_near_dup_index(near_dups)
+        print(f"Skipped {skipped} near-duplicate transcripts")
 
+    print(f"Added {added} new transcripts, {len(existing)} total")
+    return existing
 
-def collect_from_cspan():
-    """Collect transcripts from C-SPAN."""
+
+def collect_from_cspan(refresh=False):
+    """Collect transcripts from C-SPAN, bypassing its HTTP cache if refresh is set."""
     print("\n=== Collecting from C-SPAN ===")
     try:
-        from cspan_collector import collect_all_speakers
+        from cspan_collector import clear_http_cache, collect_all_speakers
+        if refresh:
+            clear_http_cache()
         transcripts = collect_all_speakers(max_per_speaker=3)
         return transcripts
     except ImportError:
@@ -137,67 +420,152 @@ def collect_from_youtube(video_list=None):
         return []
 
 
+def _is_word_char(text, i):
+    """Check whether text[i] exists and would match regex \\w."""
+    return 0 <= i < len(text) and (text[i].isalnum() or text[i] == '_')
+
+
+def _keyword_hits(text):
+    """Yield (offset, categories) for every whole-word quote keyword in text.
+
+    The whole transcript is lowercased and scanned in one pass, by the
+    Aho-Corasick automaton when available and otherwise by the fused regex,
+    so the per-character work stays in C rather than a per-sentence loop.
+    """
+    lowered = text.lower()
+
+    # Hit offsets only line up with text if lowercasing keeps its length
+    if len(lowered) != len(text):
+        for m in _QUOTE_RE_ANYCASE.finditer(text):
+            yield m.start(), _CAT_MAP[m.lastgroup]
+        return
+
+    if _AUTOMATON is None:
+        for m in _QUOTE_RE.finditer(lowered):
+            yield m.start(), _CAT_MAP[m.lastgroup]
+        return
+
+    for last, (length, cats) in _AUTOMATON.iter(lowered):
+        first = last - length + 1
+        # Only whole words count, matching the \b anchors of _QUOTE_RE
+        if not (_is_word_char(lowered, first - 1) or _is_word_char(lowered, last + 1)):
+            yield first, cats
+
+
+def _sentence_spans(text):
+    """Yield the (start, end) offsets of the sentences _SENT_SPLIT.split(text) would produce."""
+    prev = 0
+    for m in _SENT_SPLIT.finditer(text):
+        yield prev, m.start()
+        prev = m.end()
+    yield prev, len(text)
+
+
+def _classified_sentences(text):
+    """Yield (sentence, categories) for each quotable sentence that contains keywords.
+
+    Keywords never contain sentence punctuation and hits arrive in text order,
+    so sentence spans and hits are walked together; only sentences with hits
+    that pass the length filter are sliced out of text.
+    """
+    hits = _keyword_hits(text)
+    hit = next(hits, None)
+
+    for start, end in _sentence_spans(text):
+        if hit is None:
+            return
+        if hit[0] >= end:
+            continue
+
+        matched = set()
+        while hit is not None and hit[0] < end:
+            matched.update(hit[1])
+            hit = next(hits, None)
+
+        # Stripping only shrinks a span, so short spans are skipped unsliced
+        if end - start < 20:
+            continue
+        sentence = text[start:end].strip()
+        if 20 <= len(sentence) <= 300:
+            yield sentence, matched
+
+
+def extract_quotes(transcript):
+    """Extract every notable quote from one transcript's full text."""
+    quotes = []
+
+    for sentence, matched in _classified_sentences(transcript.get('fullText', '')):
+        rhetoric = matched & _RHETORIC_CATEGORIES
+        categories = matched - _RHETORIC_CATEGORIES
+
+        # Only keep quotes with notable rhetoric or categories
+        if rhetoric or len(categories) >= 2:
+            quotes.append({
+                "id": f"{transcript['id']}-q{len(quotes)}",
+                "text": sentence,
+                "categories": list(categories),
+                "rhetoric": list(rhetoric),
+                "factCheck": {"rating": "unverified", "source": None, "sourceUrl": None}
+            })
+
+    return quotes
+
+
+def needs_analysis(transcript):
+    """Check whether a transcript has text but no extracted quotes yet."""
+    return bool(transcript.get('fullText')) and not transcript.get('extractedQuotes')
+
+
+def store_quotes(transcript, quotes):
+    """Attach extracted quotes to a transcript."""
+    transcript['extractedQuotes'] = quotes[:10]  # Limit to 10 quotes per transcript
+    print(f"  {transcript.get('speaker', 'Unknown')}: extracted {len(quotes)} quotes")
+
+
 def run_analysis(transcripts):
     """Run quote extraction and analysis on transcripts."""
     print("\n=== Running Analysis ===")
 
-    # Simple quote extraction based on patterns
-    quote_patterns = [
-        # Absolutist claims
-        (r'\b(always|never|everyone|no one|every single|all of|none of)\b', 'absolutist-claims'),
-        # Dehumanizing language
-        (r'\b(animal|vermin|pest|infestation|invasion|flood|alien)\b', 'dehumanizing-language'),
-        # Violent rhetoric
-        (r'\b(destroy|eliminate|wipe out|fight|attack|war on|enemy)\b', 'violent-rhetoric'),
-        # Immigration topics
-        (r'\b(immigrant|border|deportation|migrant|illegal|alien)\b', 'immigration'),
-        # Election topics
-        (r'\b(vote|election|ballot|fraud|rigged|stolen)\b', 'election'),
-    ]
-
-    import re
-
     for transcript in transcripts:
-        if transcript.get('extractedQuotes'):
-            continue  # Already has quotes
+        if needs_analysis(transcript):
+            store_quotes(transcript, extract_quotes(transcript))
 
-        text = transcript.get('fullText', '')
-        if not text:
-            continue
+    return transcripts
 
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        quotes = []
 
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if len(sentence) < 20 or len(sentence) > 300:
-                continue
+def collect_and_analyze(collectors, known_ids):
+    """Run each collector and analyze its new transcripts in worker processes.
 
-            categories = []
-            rhetoric = []
-
-            for pattern, category in quote_patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    if category in ['absolutist-claims', 'dehumanizing-language', 'violent-rhetoric']:
-                        rhetoric.append(category)
-                    else:
-                        categories.append(category)
-
-            # Only keep quotes with notable rhetoric or categories
-            if rhetoric or len(categories) >= 2:
-                quotes.append({
-                    "id": f"{transcript['id']}-q{len(quotes)}",
-                    "text": sentence,
-                    "categories": list(set(categories)),
-                    "rhetoric": list(set(rhetoric)),
-                    "factCheck": {"rating": "unverified", "source": None, "sourceUrl": None}
-                })
-
-        transcript['extractedQuotes'] = quotes[:10]  # Limit to 10 quotes per transcript
-        print(f"  {transcript.get('speaker', 'Unknown')}: extracted {len(quotes)} quotes")
+    Quote extraction is CPU-bound while collection waits on the network, so
+    each source's transcripts are handed to a process pool as soon as it
+    returns and are analyzed while the next source is being collected. The
+    pool is only started once there is something to analyze, and starts no
+    more workers than there are transcripts waiting.
+    """
+    new_transcripts = []
+    pending = []
+    pool = None
 
-    return transcripts
+    try:
+        for collect in collectors:
+            for t in collect():
+                if t['id'] in known_ids:
+                    continue
+                new_transcripts.append(t)
+                if needs_analysis(t):
+                    if pool is None:
+                        pool = process_pool()
+                    pending.append((t, pool.submit(extract_quotes, t)))
+
+        if pending:
+            print("\n=== Running Analysis ===")
+        for t, future in pending:
+            store_quotes(t, future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return new_transcripts
 
 
 def main():
@@ -211,43 +579,67 @@ def main():
     parser.add_argument("--all", "-a", action="store_true", help="Collect from all sources")
     parser.add_argument("--analyze", action="store_true", help="Run analysis on collected transcripts")
     parser.add_argument("--youtube-list", help="JSON file with YouTube video list")
+    parser.add_argument("--pretty", action="store_true", help="Indent transcripts.json for human reading")
+    parser.add_argument("--no-cache", action="store_true", help="Clear the C-SPAN HTTP cache before collecting")
 
     args = parser.parse_args()
 
-    # Load existing
-    existing = load_existing_transcripts()
-    print(f"Loaded {len(existing)} existing transcripts")
-
-    all_new = []
+    # Stored ids let collected duplicates be dropped before they are analyzed
+    known_ids = load_id_index(DATA_DIR / 'transcripts.json')
 
     # Collect from selected sources
+    collectors = []
     if args.all or args.cspan:
-        all_new.extend(collect_from_cspan())
+        collectors.append(functools.partial(collect_from_cspan, args.no_cache))
 
     if args.all or args.whitehouse:
-        all_new.extend(collect_from_whitehouse())
+        collectors.append(collect_from_whitehouse)
 
     if args.all or args.youtube:
         video_list = None
         if args.youtube_list:
             with open(args.youtube_list) as f:
                 video_list = json.load(f)
-        all_new.extend(collect_from_youtube(video_list))
+        collectors.append(functools.partial(collect_from_youtube, video_list))
+
+    all_new = collect_and_analyze(collectors, known_ids) if collectors else []
+
+    if not all_new and not args.analyze:
+        print(f"No new transcripts collected ({len(known_ids)} existing)")
+        print("\nDone!")
+        return
+
+    # Load existing
+    database = load_database()
+    existing = database['transcripts']
+    print(f"Loaded {len(existing)} existing transcripts")
+
+    # Stats must describe the stored transcripts exactly to be updated incrementally
+    stats = database.setdefault('stats', {})
+    stats_current = stats_match(stats, existing)
 
     # Merge
+    existing_count = len(existing)
     if all_new:
         merged = merge_transcripts(existing, all_new)
     else:
         merged = existing
         print("No new transcripts collected")
+    added = merged[existing_count:]
+
+    # New transcripts were analyzed during collection; re-check everything on request
+    if args.analyze:
+        run_analysis(merged)
 
-    # Analyze
-    if args.analyze or all_new:
-        merged = run_analysis(merged)
+    # Recount stats after a full analysis, otherwise just add the new transcripts
+    if args.analyze or not stats_current:
+        rebuild_stats(stats, merged)
+    else:
+        update_stats(stats, added)
 
     # Save
-    if merged:
-        save_transcripts(merged)
+    if args.analyze or added:
+        save_transcripts(database, pretty=args.pretty)
 
     print("\nDone!")
 
@@ -6,20 +6,42 @@ Scrapes transcripts from C-SPAN's website for political speeches and hearings.
 C-SPAN provides full transcripts for most congressional proceedings.
 """
 
+import calendar
 import json
 import re
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urljoin
 
+from page_encoding import header_charset
+from transcript_ids import canonical_url, url_id
+
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    from soup_strainers import AnyStrainer, class_words
 except ImportError:
     print("Please install required packages: pip install requests beautifulsoup4")
     sys.exit(1)
 
+# Prefer the C-based lxml parser; html.parser is the pure-Python fallback
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional on-disk HTTP cache so repeat runs don't refetch unchanged pages
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
 # Base URLs
 CSPAN_BASE = "https://www.c-span.org"
 CSPAN_SEARCH = "https://www.c-span.org/search/"
@@ -70,6 +92,83 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.5"
 }
 
+# Cached responses are kept for a day
+HTTP_CACHE_FILE = Path(__file__).resolve().parent.parent / 'data' / 'http_cache.sqlite'
+HTTP_CACHE_EXPIRE = 86400
+
+# Shared session so page fetches reuse keep-alive connections (and the cache)
+if CachedSession is not None:
+    HTTP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    SESSION = CachedSession(str(HTTP_CACHE_FILE), backend='sqlite', expire_after=HTTP_CACHE_EXPIRE, allowable_codes=(200,))
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.5))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Concurrent transcript fetches per speaker search
+MAX_WORKERS = 8
+
+_WS_RE = re.compile(r'\s+')
+
+# Search pages only need the result items; the class is matched on the raw
+# attribute string, so look for it as a whole word
+_RESULTS_STRAINER = SoupStrainer(class_=class_words('video-result'))
+
+# Video pages only need what get_video_transcript() looks at: the transcript
+# container, embedded scripts and links to a separate transcript page
+_VIDEO_STRAINER = AnyStrainer(
+    SoupStrainer('script'),
+    SoupStrainer(id='transcript-content'),
+    SoupStrainer(class_=class_words('transcript')),
+    SoupStrainer(attrs={'data-transcript': True}),
+    SoupStrainer('a', href=re.compile('transcript'))
+)
+
+# Transcript pages only need the candidate content areas
+_TRANSCRIPT_STRAINER = AnyStrainer(
+    SoupStrainer('article'),
+    SoupStrainer(id='main-content'),
+    SoupStrainer(class_=class_words('content', 'transcript-text'))
+)
+
+# C-SPAN dates: "January 5, 2025" / "Jan 5, 2025", "1/5/2025" or "2025-01-05"
+_DATE_RE = re.compile(
+    r'(?P<mon>[A-Za-z]+)\s+(?P<d>\d{1,2}),\s+(?P<y>\d{4})'
+    r'|(?P<m2>\d{1,2})/(?P<d2>\d{1,2})/(?P<y2>\d{4})'
+    r'|(?P<y3>\d{4})-(?P<m3>\d{1,2})-(?P<d3>\d{1,2})'
+)
+_MONTHS = {
+    name.lower(): i
+    for i in range(1, 13)
+    for name in (calendar.month_name[i], calendar.month_abbr[i])
+}
+
+# Event-type keywords in priority order: a title mentioning several gets the
+# earliest label listed here, wherever the keywords appear in the title
+_EVENT_KEYWORDS = (
+    ('hearing', 'hearing'),
+    ('testimony', 'testimony'),
+    ('briefing', 'press|briefing'),
+    ('speech', 'speech|address|remarks'),
+    ('interview', 'interview'),
+    ('rally', 'rally'),
+    ('debate', 'debate'),
+)
+_EVENT_RE = re.compile('|'.join(f'(?P<{label}>{alts})' for label, alts in _EVENT_KEYWORDS), re.IGNORECASE)
+_EVENT_PRIORITY = {label: i for i, (label, _) in enumerate(_EVENT_KEYWORDS)}
+
+
+def make_soup(response, parse_only=None):
+    """Parse a response from its raw bytes and header_charset()."""
+    return BeautifulSoup(
+        response.content,
+        HTML_PARSER,
+        parse_only=parse_only,
+        from_encoding=header_charset(response)
+    )
+
 
 def search_cspan(query, page=1, per_page=20):
     """Search C-SPAN for videos matching query."""
@@ -82,9 +181,9 @@ def search_cspan(query, page=1, per_page=20):
     }
 
     try:
-        response = requests.get(CSPAN_SEARCH, params=params, headers=HEADERS, timeout=30)
+        response = SESSION.get(CSPAN_SEARCH, params=params, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(response, parse_only=_RESULTS_STRAINER)
 
         results = []
         for item in soup.select('.video-result'):
@@ -110,9 +209,9 @@ def search_cspan(query, page=1, per_page=20):
 def get_video_transcript(video_url):
     """Fetch transcript from a C-SPAN video page."""
     try:
-        response = requests.get(video_url, headers=HEADERS, timeout=30)
+        response = SESSION.get(video_url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(response, parse_only=_VIDEO_STRAINER)
 
         # C-SPAN stores transcripts in different ways
         # Try to find the transcript container
@@ -121,7 +220,7 @@ def get_video_transcript(video_url):
         if transcript_container:
             # Clean up the transcript text
             text = transcript_container.get_text(separator=' ')
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _WS_RE.sub(' ', text).strip()
             return text
 
         # Try to find embedded transcript data
@@ -149,15 +248,15 @@ def get_video_transcript(video_url):
 def get_transcript_page(transcript_url):
     """Fetch transcript from a dedicated transcript page."""
     try:
-        response = requests.get(transcript_url, headers=HEADERS, timeout=30)
+        response = SESSION.get(transcript_url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(response, parse_only=_TRANSCRIPT_STRAINER)
 
         # Find the main content area
         content = soup.select_one('article, .content, #main-content, .transcript-text')
         if content:
             text = content.get_text(separator=' ')
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _WS_RE.sub(' ', text).strip()
             return text
 
         return None
@@ -172,19 +271,21 @@ def parse_date(date_str):
     if not date_str:
         return datetime.now().strftime("%Y-%m-%d")
 
-    # Try common formats
-    formats = [
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%Y-%m-%d"
-    ]
+    m = _DATE_RE.fullmatch(date_str.strip())
+    if m:
+        if m.group('mon'):
+            month = _MONTHS.get(m.group('mon').lower())
+            day, year = m.group('d'), m.group('y')
+        elif m.group('m2'):
+            month, day, year = int(m.group('m2')), m.group('d2'), m.group('y2')
+        else:
+            month, day, year = int(m.group('m3')), m.group('d3'), m.group('y3')
 
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+        if month:
+            try:
+                return date(int(year), month, int(day)).isoformat()
+            except ValueError:
+                pass
 
     return datetime.now().strftime("%Y-%m-%d")
 
@@ -198,20 +299,30 @@ def collect_speaker_transcripts(speaker_id, max_results=10):
 
     transcripts = []
 
-    for search_term in speaker["search_terms"]:
-        print(f"Searching for: {search_term}")
-        results = search_cspan(search_term, per_page=max_results)
-
-        for result in results:
+    # One quoted-OR search covers every alias; drop results listed twice
+    query = " OR ".join(f'"{term}"' for term in speaker["search_terms"])
+    print(f"Searching for: {query}")
+    seen = set()
+    results = []
+    for result in search_cspan(query, per_page=max_results):
+        key = canonical_url(result['url'])
+        if key not in seen:
+            seen.add(key)
+            results.append(result)
+
+    # Fetch transcripts concurrently; results come back in search order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        texts = executor.map(get_video_transcript, [r['url'] for r in results])
+
+        for result, transcript_text in zip(results, texts):
             print(f"  Processing: {result['title']}")
 
-            transcript_text = get_video_transcript(result['url'])
             if not transcript_text or len(transcript_text) < 500:
                 print(f"    No transcript or too short, skipping")
                 continue
 
             transcripts.append({
-                "id": f"cspan-{hash(result['url']) & 0xFFFFFFFF:08x}",
+                "id": f"cspan-{url_id(result['url'])}",
                 "speaker": speaker["name"],
                 "speakerId": speaker_id,
                 "role": speaker["roles"][0] if speaker["roles"] else None,
@@ -231,24 +342,10 @@ def collect_speaker_transcripts(speaker_id, max_results=10):
 
 def detect_event_type(title):
     """Detect the type of event from the title."""
-    title_lower = title.lower()
-
-    if 'hearing' in title_lower:
-        return 'hearing'
-    elif 'testimony' in title_lower:
-        return 'testimony'
-    elif 'press' in title_lower or 'briefing' in title_lower:
-        return 'briefing'
-    elif 'speech' in title_lower or 'address' in title_lower or 'remarks' in title_lower:
-        return 'speech'
-    elif 'interview' in title_lower:
-        return 'interview'
-    elif 'rally' in title_lower:
-        return 'rally'
-    elif 'debate' in title_lower:
-        return 'debate'
-    else:
-        return 'speech'
+    labels = {m.lastgroup for m in _EVENT_RE.finditer(title)}
+    if labels:
+        return min(labels, key=_EVENT_PRIORITY.__getitem__)
+    return 'speech'
 
 
 def collect_all_speakers(max_per_speaker=5, output_file="../data/cspan_transcripts.json"):
@@ -276,6 +373,12 @@ def collect_all_speakers(max_per_speaker=5, output_file="../data/cspan_transcrip
     return all_transcripts
 
 
+def clear_http_cache():
+    """Drop cached responses so the next fetches go to the network."""
+    if CachedSession is not None:
+        SESSION.cache.clear()
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -285,9 +388,13 @@ def main():
     parser.add_argument("--max", "-m", type=int, default=5, help="Max transcripts per speaker")
     parser.add_argument("--output", "-o", default="../data/cspan_transcripts.json", help="Output file")
     parser.add_argument("--url", "-u", help="Collect from specific C-SPAN URL")
+    parser.add_argument("--no-cache", action="store_true", help="Clear the HTTP cache before collecting")
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        clear_http_cache()
+
     if args.url:
         # Process single URL
         print(f"Fetching transcript from: {args.url}")
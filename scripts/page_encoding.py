@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Page Encoding
+Charset handling for the HTML collectors.
+
+Pages are handed to the parsers as raw bytes together with the charset from
+the Content-Type header, and the parsers decode them (header charset, then
+<meta charset>). That skips building response.text, and with it the
+ISO-8859-1 default requests applies to text/html served without a charset.
+"""
+
+import re
+
+_CHARSET_RE = re.compile(r'charset=["\']?([^"\';\s]+)', re.IGNORECASE)
+
+
+def header_charset(response):
+    """Return the charset named in a response's Content-Type header, or None."""
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
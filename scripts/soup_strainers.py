@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Soup Strainers
+Shared SoupStrainer helpers for the HTML collectors.
+
+A page parsed with parse_only keeps just the tags a strainer allows, with
+their whole subtree, so selectors that only reach into those tags resolve
+exactly as they would on the full page. Needs beautifulsoup4 4.13 or later,
+which checks strainers with allow_tag_creation().
+"""
+
+import re
+
+from bs4 import SoupStrainer
+
+
+class AnyStrainer(SoupStrainer):
+    """Keep a tag (and its subtree) when any of the given strainers would."""
+
+    def __init__(self, *strainers):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+    def allow_string_creation(self, string):
+        return False
+
+
+def class_words(*names):
+    """Match any of the class names as a whole word of the raw class attribute."""
+    return re.compile(r'(?:^|\s)(?:' + '|'.join(map(re.escape, names)) + r')(?:\s|$)')
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Stable Transcript IDs
+Derives transcript IDs from source URLs.
+
+Python's built-in hash() is salted per process (PYTHONHASHSEED), so IDs built
+from it change between runs and defeat deduplication. BLAKE2b gives the same
+8-hex-digit ID for the same URL every time. URLs are canonicalized first so
+trivially different spellings of one page share an ID.
+"""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def canonical_url(url):
+    """Normalize a URL: lowercase scheme and host, no trailing slash, sorted query, no fragment."""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+def url_id(url):
+    """Return a stable 8-hex-digit ID for a URL."""
+    return hashlib.blake2b(canonical_url(url).encode('utf-8'), digest_size=4).hexdigest()
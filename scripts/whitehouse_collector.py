@@ -9,18 +9,32 @@ The White House publishes official transcripts of:
 - Statements and releases
 """
 
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
 
+from page_encoding import header_charset
+from transcript_ids import canonical_url, url_id
+from worker_pools import process_pool
+
 try:
+    import lxml.html
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    from bs4.dammit import EncodingDetector
+    from lxml import etree
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    from soup_strainers import AnyStrainer, class_words
 except ImportError:
-    print("Please install required packages: pip install requests beautifulsoup4")
+    print("Please install required packages: pip install requests beautifulsoup4 lxml")
     sys.exit(1)
 
 # White House Briefing Room URLs
@@ -36,7 +50,39 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
 }
 
-# Speaker identification patterns
+# Shared session so article fetches reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Concurrent article fetches per collection run
+MAX_WORKERS = 8
+
+# Articles with less text than this are skipped as releases, not transcripts
+MIN_TRANSCRIPT_LENGTH = 500
+
+# Pages larger than this (attached appendices and the like) are skipped
+# rather than read and parsed in full
+MAX_PAGE_BYTES = 4_000_000
+
+# ETag/Last-Modified validators from earlier runs, stored beside the output
+# files; unchanged articles come back as 304 and reuse their prior record
+FETCH_CACHE_NAME = '.wh_cache.json'
+
+# Returned in place of page content when the server answers 304
+NOT_MODIFIED = object()
+
+# (max_workers, executor) of the parse pool, created on first use
+_pool = None
+
+# Speaker identification patterns. They are matched case-sensitively against
+# lowercased text, so literal letters must be written in lowercase.
 SPEAKER_PATTERNS = {
     "donald-trump": [
         r"president\s+trump",
@@ -60,28 +106,133 @@ SPEAKER_PATTERNS = {
     ]
 }
 
+# One alternation per speaker, checked in SPEAKER_PATTERNS order: the first
+# speaker with any match wins, wherever in the text the match falls. The
+# patterns are lowercase and run against lowercased text, so no IGNORECASE.
+_SPEAKER_RES = {
+    speaker_id: re.compile("|".join(f"(?:{p})" for p in patterns))
+    for speaker_id, patterns in SPEAKER_PATTERNS.items()
+}
+
+_NEWLINES_RE = re.compile(r'\n{3,}')
+_SPACES_RE = re.compile(r' {2,}')
+
+# Trailing share/related/tags sections: everything from the first marker on
+# is dropped ('###' separators are removed beforehand, as they always were)
+_TRAILER_MARKERS = ('share this:', 'related articles', 'tags:')
+_TRAILER_RE = re.compile('|'.join(map(re.escape, _TRAILER_MARKERS)), re.IGNORECASE)
+
+# Listing pages only need the elements the link selector can reach. Matching
+# tags keep their whole subtree, so descendant selectors still resolve.
+_LIST_STRAINER = AnyStrainer(
+    SoupStrainer(['article', 'h2']),
+    SoupStrainer(class_=class_words('briefing-statement', 'news-item'))
+)
+
+
+def _xp_class(name):
+    """XPath predicate matching a whole word of the class attribute, like CSS `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Article pages are read with compiled XPath straight off the lxml tree. Each
+# union is in document order, so [1] picks the same element as the original
+# CSS select_one() chains.
+_TITLE_XP = etree.XPath(
+    f"(//h1 | //*[{_xp_class('page-title')}] | //article//h1)[1]"
+)
+_DATE_XP = etree.XPath(
+    f"(//time | //*[{_xp_class('date')}] | //*[{_xp_class('posted-on')}] | //*[@datetime])[1]"
+)
+_BODY_XP = etree.XPath(
+    f"(//article//*[{_xp_class('entry-content')}] | //*[{_xp_class('body-content')}]"
+    f" | //article//*[{_xp_class('content')}] | //main//article)[1]"
+)
+_STRIP_XP = etree.XPath(
+    f".//script | .//style | .//nav | .//*[{_xp_class('share-buttons')}] | .//*[{_xp_class('related')}]"
+)
+
+# Text nodes as bs4's get_text() sees them: script, style and template
+# contents are not text
+_TEXT_XP = etree.XPath('.//text()[not(parent::script or parent::style or ancestor::template)]')
+_IN_PRE_XP = etree.XPath('boolean(ancestor-or-self::pre | ancestor-or-self::textarea)')
+_ASCII_SPACES = ' \t\n\r\f'
+
+# Most article bodies have nothing the filters above would act on (once
+# _STRIP_XP has emptied their script/style tags), so all their text nodes
+# can be taken in one unfiltered walk
+_PLAIN_TEXT_XP = etree.XPath('.//text()', smart_strings=False)
+_SPECIAL_TEXT_XP = etree.XPath(
+    'boolean(ancestor-or-self::pre | ancestor-or-self::textarea | ancestor-or-self::template'
+    ' | .//pre | .//textarea | .//template | .//script[text()] | .//style[text()])'
+)
+
+
+def fetch_html(url, validators=None):
+    """Fetch a web page and return (raw bytes, header_charset(), validators).
+
+    Given validators from an earlier fetch, the request is conditional and
+    NOT_MODIFIED is returned if the page hasn't changed.
+    """
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
 
-def get_page_content(url):
-    """Fetch and parse a web page."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        with SESSION.get(url, timeout=30, stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+            if int(response.headers.get('Content-Length') or 0) > MAX_PAGE_BYTES:
+                print(f"Skipping {url}: larger than {MAX_PAGE_BYTES} bytes")
+                return None
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(65536):
+                size += len(chunk)
+                if size > MAX_PAGE_BYTES:
+                    print(f"Skipping {url}: larger than {MAX_PAGE_BYTES} bytes")
+                    return None
+                chunks.append(chunk)
+
+            new_validators = {
+                key: value
+                for key, value in (
+                    ('etag', response.headers.get('ETag')),
+                    ('last_modified', response.headers.get('Last-Modified'))
+                )
+                if value
+            }
+            return b''.join(chunks), header_charset(response), new_validators or None
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 
+def get_page_content(url, parse_only=None):
+    """Fetch and parse a web page."""
+    page = fetch_html(url)
+    if page is None:
+        return None
+    html, encoding, _ = page
+    return BeautifulSoup(html, 'lxml', parse_only=parse_only, from_encoding=encoding)
+
+
 def get_briefing_room_articles(section_url, max_pages=3):
     """Get list of articles from a briefing room section."""
     articles = []
+    seen = set()
 
     for page in range(1, max_pages + 1):
         url = f"{section_url}page/{page}/" if page > 1 else section_url
         print(f"  Fetching page {page}...")
 
-        soup = get_page_content(url)
-        if not soup:
+        soup = get_page_content(url, parse_only=_LIST_STRAINER)
+        if soup is None:
             break
 
         # Find article links - structure may vary
@@ -89,23 +240,47 @@ def get_briefing_room_articles(section_url, max_pages=3):
 
         for link in article_links:
             href = link.get('href', '')
-            if '/briefing-room/' in href and href not in [a['url'] for a in articles]:
-                title = link.get_text(strip=True)
-                if title and len(title) > 10:
-                    articles.append({
-                        "url": href if href.startswith('http') else urljoin(WH_BASE, href),
-                        "title": title
-                    })
+            if '/briefing-room/' not in href:
+                continue
+
+            # Relative and absolute links to the same page share one key
+            article_url = href if href.startswith('http') else urljoin(WH_BASE, href)
+            key = canonical_url(article_url)
+            if key in seen:
+                continue
+
+            title = link.get_text(strip=True)
+            if title and len(title) > 10:
+                seen.add(key)
+                articles.append({
+                    "url": article_url,
+                    "title": title
+                })
 
     return articles
 
 
-def get_article_transcript(url):
-    """Extract transcript from a White House article page."""
-    soup = get_page_content(url)
-    if not soup:
-        return None
+def get_article_transcript(url, validators=None):
+    """Extract transcript from a White House article page.
+
+    Returns NOT_MODIFIED instead if validators are given and still current.
+    """
+    page = fetch_html(url, validators)
+    if page is None or page is NOT_MODIFIED:
+        return page
+    html, encoding, new_validators = page
+
+    result = parse_html(html, url, encoding)
+    result["validators"] = new_validators
+    return result
 
+
+def parse_html(html, url, encoding=None):
+    """Extract the transcript fields from an article page's raw bytes.
+
+    Needs no network or shared state and returns a plain dict, so it can run
+    in a worker process.
+    """
     result = {
         "url": url,
         "title": None,
@@ -114,25 +289,39 @@ def get_article_transcript(url):
         "speaker": None
     }
 
+    try:
+        root = _parse_html(html, encoding)
+    except etree.ParserError:
+        return result
+
     # Get title
-    title_el = soup.select_one('h1, .page-title, article h1')
+    title_el = _TITLE_XP(root)
     if title_el:
-        result["title"] = title_el.get_text(strip=True)
+        result["title"] = _stripped_text(title_el[0])
 
     # Get date
-    date_el = soup.select_one('time, .date, .posted-on, [datetime]')
+    date_el = _DATE_XP(root)
     if date_el:
-        date_str = date_el.get('datetime') or date_el.get_text(strip=True)
+        date_str = date_el[0].get('datetime') or _stripped_text(date_el[0])
         result["date"] = parse_date(date_str)
 
     # Get main content
-    content_el = soup.select_one('article .entry-content, .body-content, article .content, main article')
+    content_el = _BODY_XP(root)
     if content_el:
-        # Remove unwanted elements
-        for unwanted in content_el.select('script, style, nav, .share-buttons, .related'):
-            unwanted.decompose()
+        content_el = content_el[0]
+
+        # Remove unwanted elements; keep_tail leaves the text that follows
+        # each one as its own text node, as decompose() did
+        for unwanted in _STRIP_XP(content_el):
+            unwanted.clear(keep_tail=True)
+
+        text = '\n'.join(_text_nodes(content_el))
+
+        # Cleaning only ever shortens the text, so a page already under the
+        # minimum can't become a transcript; skip cleaning and speaker lookup
+        if len(text) < MIN_TRANSCRIPT_LENGTH:
+            return result
 
-        text = content_el.get_text(separator='\n')
         text = clean_transcript(text)
         result["text"] = text
 
@@ -142,34 +331,186 @@ def get_article_transcript(url):
     return result
 
 
+def _parse_html(html, encoding=None):
+    """Parse page bytes with lxml, decoding them as bs4 would.
+
+    A usable header charset is trusted; otherwise lxml follows the page's
+    <meta charset>. Pages declaring neither are read as UTF-8 if they
+    decode as UTF-8, not as lxml's default Latin-1.
+    """
+    if encoding:
+        try:
+            # A parser is cheap next to the parse itself, and a fresh one per
+            # page is safe whether this runs in a parse worker or on a thread
+            return lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+        except LookupError:
+            pass
+    if EncodingDetector.find_declared_encoding(html, is_html=True) is None and _is_utf8(html):
+        return lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding='utf-8'))
+    return lxml.html.fromstring(html)
+
+
+def _is_utf8(data):
+    """Check whether bytes are valid UTF-8."""
+    try:
+        data.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _text_nodes(el):
+    """Return an element's text nodes, with whitespace-only runs collapsed as bs4 does.
+
+    Outside <pre> and <textarea>, bs4 stores a string of nothing but ASCII
+    whitespace as a single newline (if it has one) or space.
+    """
+    if not _SPECIAL_TEXT_XP(el):
+        return [
+            s if s.strip(_ASCII_SPACES) else ('\n' if '\n' in s else ' ')
+            for s in _PLAIN_TEXT_XP(el)
+        ]
+
+    nodes = []
+    for s in _TEXT_XP(el):
+        if s.strip(_ASCII_SPACES):
+            nodes.append(s)
+            continue
+        parent = s.getparent()
+        if s.is_tail:
+            parent = parent.getparent()
+        if _IN_PRE_XP(parent):
+            nodes.append(s)
+        else:
+            nodes.append('\n' if '\n' in s else ' ')
+    return nodes
+
+
+def _stripped_text(el):
+    """Concatenate an element's text nodes, each stripped (bs4's get_text(strip=True))."""
+    return ''.join(s.strip() for s in _TEXT_XP(el))
+
+
+def fetch_articles(articles, validators=None):
+    """Fetch and parse article transcripts; results come back in listing order.
+
+    Pages are fetched on threads, since that is network-bound. Parsing is
+    CPU-bound and would serialize on the GIL, so each page is handed to a
+    process pool as soon as it arrives and parses while later pages download.
+    Entries are None for failed fetches and NOT_MODIFIED for unchanged pages.
+    """
+    urls = [a['url'] for a in articles]
+    if not urls:
+        return []
+    validators = validators or {}
+    parsed = []
+    pool = _parse_pool(min(len(urls), os.cpu_count() or 1))
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as fetcher:
+        pages = fetcher.map(fetch_html, urls, [validators.get(u) for u in urls])
+        for url, page in zip(urls, pages):
+            if page is None or page is NOT_MODIFIED:
+                parsed.append((page, None))
+            else:
+                html, encoding, new_validators = page
+                parsed.append((pool.submit(parse_html, html, url, encoding), new_validators))
+
+        results = []
+        for future, new_validators in parsed:
+            if future is None or future is NOT_MODIFIED:
+                results.append(future)
+            else:
+                result = future.result()
+                result["validators"] = new_validators
+                results.append(result)
+
+    return results
+
+
+def _parse_pool(workers):
+    """Return the shared parse pool, replacing it if it has fewer than workers.
+
+    The pool lives across collection runs, so workers keep their parse_date()
+    cache and are not restarted for every section.
+    """
+    global _pool
+    if _pool is None or _pool[0] < workers:
+        if _pool is not None:
+            _pool[1].shutdown()
+        _pool = (workers, process_pool(workers))
+    return _pool[1]
+
+
+def load_fetch_cache(output_file):
+    """Load validators and prior records for an output file, both keyed by URL.
+
+    Only URLs that still have a record in the prior output get validators,
+    since a 304 for anything else would leave nothing to reuse.
+    """
+    output_path = Path(output_file)
+    try:
+        cache = json.loads((output_path.parent / FETCH_CACHE_NAME).read_text())
+    except (OSError, ValueError):
+        cache = {}
+    try:
+        prior = {t['sourceUrl']: t for t in json.loads(output_path.read_text())['transcripts']}
+    except (OSError, ValueError, KeyError, TypeError):
+        prior = {}
+
+    validators = {url: v for url, v in cache.get(output_path.name, {}).items() if url in prior}
+    return validators, prior
+
+
+def save_fetch_cache(output_file, validators):
+    """Store the validators for an output file's records, keeping other outputs' entries."""
+    output_path = Path(output_file)
+    cache_path = output_path.parent / FETCH_CACHE_NAME
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    cache[output_path.name] = validators
+    cache_path.write_text(json.dumps(cache, separators=(',', ':')))
+
+
 def clean_transcript(text):
     """Clean up transcript text."""
     # Remove excessive whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r' {2,}', ' ', text)
+    text = _NEWLINES_RE.sub('\n\n', text)
+    text = _SPACES_RE.sub(' ', text)
 
     # Remove common boilerplate
-    boilerplate_patterns = [
-        r'###',
-        r'Share this:.*',
-        r'Related Articles.*',
-        r'Tags:.*'
-    ]
-
-    for pattern in boilerplate_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    text = text.replace('###', '')
+    cut = _trailer_start(text)
+    if cut >= 0:
+        text = text[:cut]
 
     return text.strip()
 
 
+def _trailer_start(text):
+    """Index of the first trailing-boilerplate marker in text, or -1.
+
+    Lowercases once and uses str.find, which beats a case-insensitive
+    alternation; if lowercasing changes the length (a few non-ASCII letters
+    do), offsets no longer line up and the regex is used instead.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        match = _TRAILER_RE.search(text)
+        return match.start() if match else -1
+
+    hits = [i for i in map(lowered.find, _TRAILER_MARKERS) if i >= 0]
+    return min(hits) if hits else -1
+
+
 def identify_speaker(text, title=None):
     """Identify the primary speaker from transcript content."""
     combined = f"{title or ''} {text[:2000]}".lower()
 
-    for speaker_id, patterns in SPEAKER_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return speaker_id
+    for speaker_id, pattern in _SPEAKER_RES.items():
+        if pattern.search(combined):
+            return speaker_id
 
     return "unknown"
 
@@ -183,43 +524,56 @@ def parse_date(date_str):
     if 'T' in date_str:
         return date_str.split('T')[0]
 
-    # Try common formats
-    formats = [
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m/%d/%Y",
-        "%Y-%m-%d",
-        "%B %d %Y"
-    ]
+    return _parse_date_text(date_str.strip()) or datetime.now().strftime("%Y-%m-%d")
+
+
+# strptime formats grouped by what they can start with, so a date string is
+# only tried against the formats that could possibly match it
+_MONTH_NAME_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%B %d %Y")
+_SLASH_FORMATS = ("%m/%d/%Y",)
+_DASH_FORMATS = ("%Y-%m-%d",)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_text(date_str):
+    """Parse a non-ISO date string to ISO format, or None if no format fits."""
+    if date_str[:1].isalpha():
+        formats = _MONTH_NAME_FORMATS
+    elif '/' in date_str:
+        formats = _SLASH_FORMATS
+    else:
+        formats = _DASH_FORMATS
 
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
         except ValueError:
             continue
 
-    return datetime.now().strftime("%Y-%m-%d")
+    return None
+
+
+# Title keywords in priority order: the first one found decides the type
+_EVENT_KEYWORDS = {
+    'press briefing': 'briefing',
+    'remarks': 'speech',
+    'address': 'speech',
+    'statement': 'statement',
+    'executive order': 'executive_order',
+}
 
 
 def detect_event_type(title):
     """Detect event type from title."""
     title_lower = title.lower() if title else ""
 
-    if 'press briefing' in title_lower:
-        return 'briefing'
-    elif 'remarks' in title_lower:
-        return 'speech'
-    elif 'address' in title_lower:
-        return 'speech'
-    elif 'statement' in title_lower:
-        return 'statement'
-    elif 'executive order' in title_lower:
-        return 'executive_order'
-    else:
-        return 'speech'
+    for keyword, event_type in _EVENT_KEYWORDS.items():
+        if keyword in title_lower:
+            return event_type
+    return 'speech'
 
 
-def collect_speeches(max_articles=20, output_file="../data/whitehouse_transcripts.json"):
+def collect_speeches(max_articles=20, output_file="../data/whitehouse_transcripts.json", pretty=False):
     """Collect transcripts from White House speeches and remarks."""
     print("Collecting White House speeches and remarks...")
 
@@ -228,12 +582,19 @@ def collect_speeches(max_articles=20, output_file="../data/whitehouse_transcript
 
     transcripts = []
     processed = 0
+    validators, prior = load_fetch_cache(output_file)
+    fetched = {}
 
-    for article in articles[:max_articles]:
+    for article, result in zip(articles, fetch_articles(articles[:max_articles], validators)):
         print(f"Processing: {article['title'][:60]}...")
 
-        result = get_article_transcript(article['url'])
-        if not result or not result['text'] or len(result['text']) < 500:
+        if result is NOT_MODIFIED:
+            transcripts.append(prior[article['url']])
+            fetched[article['url']] = validators[article['url']]
+            print("  Unchanged since last run")
+            continue
+
+        if not result or not result['text'] or len(result['text']) < MIN_TRANSCRIPT_LENGTH:
             print("  Skipping (no content or too short)")
             continue
 
@@ -241,7 +602,7 @@ def collect_speeches(max_articles=20, output_file="../data/whitehouse_transcript
         speaker_name = get_speaker_name(speaker_id)
 
         transcripts.append({
-            "id": f"wh-{hash(article['url']) & 0xFFFFFFFF:08x}",
+            "id": f"wh-{url_id(article['url'])}",
             "speaker": speaker_name,
             "speakerId": speaker_id,
             "role": get_speaker_role(speaker_id),
@@ -254,23 +615,48 @@ def collect_speeches(max_articles=20, output_file="../data/whitehouse_transcript
             "extractedQuotes": []
         })
 
+        if result['validators']:
+            fetched[article['url']] = result['validators']
+
         processed += 1
         print(f"  Collected: {len(result['text'])} characters")
 
     # Save results
+    save_results(output_file, "White House Transcripts", transcripts, pretty=pretty)
+    save_fetch_cache(output_file, fetched)
+
+    print(f"\nCollected {len(transcripts)} transcripts to {output_file}")
+    return transcripts
+
+
+def save_results(output_file, source, transcripts, pretty=False):
+    """Write collected transcripts to a JSON file.
+
+    Output is compact unless pretty is set. Compact output is streamed one
+    transcript at a time through a large write buffer instead of being built
+    up as one string.
+    """
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        json.dump({
-            "source": "White House Transcripts",
-            "collected_at": datetime.now().isoformat(),
-            "count": len(transcripts),
-            "transcripts": transcripts
-        }, f, indent=2)
+    header = {
+        "source": source,
+        "collected_at": datetime.now().isoformat(),
+        "count": len(transcripts)
+    }
 
-    print(f"\nCollected {len(transcripts)} transcripts to {output_file}")
-    return transcripts
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        if pretty:
+            json.dump({**header, "transcripts": transcripts}, f, indent=2)
+            return
+
+        f.write(json.dumps(header, separators=(',', ':'))[:-1])
+        f.write(',"transcripts":[')
+        for i, transcript in enumerate(transcripts):
+            if i:
+                f.write(',')
+            f.write(json.dumps(transcript, separators=(',', ':')))
+        f.write(']}')
 
 
 def get_speaker_name(speaker_id):
@@ -297,7 +683,7 @@ def get_speaker_role(speaker_id):
     return roles.get(speaker_id)
 
 
-def collect_press_briefings(max_articles=10, output_file="../data/whitehouse_briefings.json"):
+def collect_press_briefings(max_articles=10, output_file="../data/whitehouse_briefings.json", pretty=False):
     """Collect transcripts from press briefings."""
     print("Collecting White House press briefings...")
 
@@ -305,17 +691,24 @@ def collect_press_briefings(max_articles=10, output_file="../data/whitehouse_bri
     print(f"Found {len(articles)} briefings")
 
     transcripts = []
+    validators, prior = load_fetch_cache(output_file)
+    fetched = {}
 
-    for article in articles[:max_articles]:
+    for article, result in zip(articles, fetch_articles(articles[:max_articles], validators)):
         print(f"Processing: {article['title'][:60]}...")
 
-        result = get_article_transcript(article['url'])
-        if not result or not result['text'] or len(result['text']) < 500:
+        if result is NOT_MODIFIED:
+            transcripts.append(prior[article['url']])
+            fetched[article['url']] = validators[article['url']]
+            print("  Unchanged since last run")
+            continue
+
+        if not result or not result['text'] or len(result['text']) < MIN_TRANSCRIPT_LENGTH:
             print("  Skipping (no content or too short)")
             continue
 
         transcripts.append({
-            "id": f"wh-briefing-{hash(article['url']) & 0xFFFFFFFF:08x}",
+            "id": f"wh-briefing-{url_id(article['url'])}",
             "speaker": "Press Secretary",
             "speakerId": "press-secretary",
             "role": "Press Secretary",
@@ -328,19 +721,14 @@ def collect_press_briefings(max_articles=10, output_file="../data/whitehouse_bri
             "extractedQuotes": []
         })
 
+        if result['validators']:
+            fetched[article['url']] = result['validators']
+
         print(f"  Collected: {len(result['text'])} characters")
 
     # Save results
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w') as f:
-        json.dump({
-            "source": "White House Briefings",
-            "collected_at": datetime.now().isoformat(),
-            "count": len(transcripts),
-            "transcripts": transcripts
-        }, f, indent=2)
+    save_results(output_file, "White House Briefings", transcripts, pretty=pretty)
+    save_fetch_cache(output_file, fetched)
 
     print(f"\nCollected {len(transcripts)} briefings to {output_file}")
     return transcripts
@@ -357,6 +745,7 @@ def main():
     parser.add_argument("--max", "-m", type=int, default=20, help="Max articles to collect")
     parser.add_argument("--output", "-o", default="../data/whitehouse_transcripts.json", help="Output file")
     parser.add_argument("--url", "-u", help="Collect from specific URL")
+    parser.add_argument("--pretty", action="store_true", help="Indent output JSON for human reading")
 
     args = parser.parse_args()
 
@@ -376,14 +765,14 @@ def main():
 
     elif args.all or (not args.speeches and not args.briefings):
         # Collect everything
-        collect_speeches(args.max, args.output)
-        collect_press_briefings(args.max // 2, args.output.replace('.json', '_briefings.json'))
+        collect_speeches(args.max, args.output, pretty=args.pretty)
+        collect_press_briefings(args.max // 2, args.output.replace('.json', '_briefings.json'), pretty=args.pretty)
 
     else:
         if args.speeches:
-            collect_speeches(args.max, args.output)
+            collect_speeches(args.max, args.output, pretty=args.pretty)
         if args.briefings:
-            collect_press_briefings(args.max, args.output.replace('.json', '_briefings.json'))
+            collect_press_briefings(args.max, args.output.replace('.json', '_briefings.json'), pretty=args.pretty)
 
 
 if __name__ == "__main__":
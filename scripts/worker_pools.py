@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Worker Pools
+Process pools for the CPU-bound parts of collection.
+
+Workers are started from a forkserver (or spawned where there is none) rather
+than forked: collectors keep fetch threads and other pools running alongside
+their workers, and forking while those threads hold locks can deadlock the
+child. Non-fork workers are also started on demand, so a pool never runs more
+of them than it has had jobs in flight.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+WORKER_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+
+def process_pool(max_workers=None):
+    """Return a process pool of at most max_workers (and one per CPU) workers."""
+    cpus = os.cpu_count() or 1
+    return ProcessPoolExecutor(
+        max_workers=min(max_workers, cpus) if max_workers else cpus,
+        mp_context=WORKER_CONTEXT
+    )